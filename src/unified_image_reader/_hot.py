@@ -0,0 +1,78 @@
+"""
+    Batch region math, compiled with numba when it's installed and vectorized with numpy otherwise
+"""
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+if NUMBA_AVAILABLE:
+
+    @njit(cache=True, parallel=True)
+    def idx_to_xy(indices, rw, rh, img_w):
+        """
+        idx_to_xy Converts region indices to the coordinates of the top-left pixel of each region
+
+        :param indices: A 1-D array of region indices
+        :type indices: np.ndarray
+        :param rw: The width of the regions
+        :type rw: int
+        :param rh: The height of the regions
+        :type rh: int
+        :param img_w: The width of the image, at least rw
+        :type img_w: int
+        :return: An (N, 2) array of (width, height) coordinates
+        :rtype: np.ndarray
+        """
+        width_regions = img_w // rw
+        out = np.empty((indices.size, 2), np.int64)
+        for i in prange(indices.size):
+            out[i, 0] = (indices[i] % width_regions) * rw
+            out[i, 1] = (indices[i] // width_regions) * rh
+        return out
+
+    @njit(cache=True, parallel=True)
+    def coords_in_bounds(coords, rw, rh, img_w, img_h):
+        """
+        coords_in_bounds Checks whether regions are within the bounds of the image
+
+        :param coords: An (N, 2) array of (width, height) coordinates of the top-left pixel of each region
+        :type coords: np.ndarray
+        :param rw: The width of the regions
+        :type rw: int
+        :param rh: The height of the regions
+        :type rh: int
+        :param img_w: The width of the image
+        :type img_w: int
+        :param img_h: The height of the image
+        :type img_h: int
+        :return: A boolean array, True where the region is in bounds
+        :rtype: np.ndarray
+        """
+        out = np.empty(coords.shape[0], np.bool_)
+        for i in prange(coords.shape[0]):
+            left = coords[i, 0]
+            top = coords[i, 1]
+            out[i] = 0 < rw and 0 < rh and 0 <= left and left + rw <= img_w \
+                and 0 <= top and top + rh <= img_h
+        return out
+
+else:  # numpy's vectorized operations beat interpreted loops
+
+    def idx_to_xy(indices, rw, rh, img_w):
+        rows, columns = np.divmod(indices, img_w // rw)
+        return np.stack((columns * rw, rows * rh), -1)
+
+    def coords_in_bounds(coords, rw, rh, img_w, img_h):
+        lefts = coords[:, 0]
+        tops = coords[:, 1]
+        return (0 < rw) & (0 < rh) & (0 <= lefts) & (lefts + rw <= img_w) & \
+            (0 <= tops) & (tops + rh <= img_h)
+
+    idx_to_xy.__doc__ = """ see the numba implementation of idx_to_xy """
+    coords_in_bounds.__doc__ = """ see the numba implementation of coords_in_bounds """
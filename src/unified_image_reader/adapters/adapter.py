@@ -4,13 +4,18 @@
     An implementation of image reading behavior that may map specific libraries to working with specific image formats
 """
 import abc
-from typing import Iterable
+from typing import Iterable, Optional, Tuple
 
 import numpy as np
 
 
 class Adapter(abc.ABC):
 
+    # whether get_region may be called from several threads at once, e.g. to read regions ahead while iterating
+    THREAD_SAFE = False
+    # whether get_region takes an optional third out argument and reads the region straight into that array
+    READS_INTO_OUT = False
+
     @abc.abstractmethod
     def get_region(self, region_coordinates: Iterable, region_dims: Iterable) -> np.ndarray:
         """get_region Get a pixel region of the image using the adapter library's implementation
@@ -24,6 +29,32 @@ class Adapter(abc.ABC):
         """
         pass
 
+    def get_regions(self, region_coordinates: Iterable, region_dims: Iterable, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """get_regions Get a batch of same-sized pixel regions of the image, stacked into one array
+
+        :param region_coordinates: A sequence of (width, height) coordinates representing the top-left pixel of each region
+        :type region_coordinates: Iterable
+        :param region_dims: A set of (width, height) coordinates representing the dimensions shared by the regions
+        :type region_dims: Iterable
+        :param out: A caller-owned array of shape (number of regions, height, width, bands) to write the regions into, defaults to None
+        :type out: Optional[np.ndarray], optional
+        :return: A numpy array whose nth entry is the nth region (out if it was provided)
+        :rtype: np.ndarray
+        """
+        if len(region_coordinates) == 0:
+            if out is not None:
+                return out
+            # nothing to read, so a 1x1 region stands in to learn the bands and dtype
+            probe = self.get_region((0, 0), (1, 1))
+            region_width, region_height = region_dims
+            return np.empty((0, region_height, region_width, *probe.shape[2:]), dtype=probe.dtype)
+        for i, coordinates in enumerate(region_coordinates):
+            region = self.get_region(coordinates, region_dims)
+            if out is None:
+                out = np.empty((len(region_coordinates), *region.shape), dtype=region.dtype)
+            out[i] = region
+        return out
+
     @abc.abstractmethod
     def get_width() -> int:
         """
@@ -37,3 +68,9 @@ class Adapter(abc.ABC):
         Get the height property of the image using the adapter library's implementation
         """
         pass
+
+    def get_tile_dims(self) -> Optional[Tuple[int, int]]:
+        """
+        Get the (width, height) of the tiles the image is stored in, or None if the adapter library doesn't expose them
+        """
+        return None
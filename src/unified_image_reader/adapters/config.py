@@ -1,2 +1,5 @@
 
-VIPS_GET_REGION = "IMAGE_CROP"  # alternatively "REGION_FETCH"
+VIPS_GET_REGION = "AUTO"  # alternatively "IMAGE_CROP" or "REGION_FETCH"
+VIPS_FETCH_AREA_THRESHOLD = 128 * 128  # in "AUTO" mode, regions with a smaller area are fetched rather than cropped
+
+VIPS_DEFAULT_TILE_DIMS = (256, 256)  # used when the image doesn't report its tile size
@@ -5,6 +5,8 @@
     Adapter currently mapped to reading .tif, tiff files
 """
 
+import threading
+
 import numpy as np
 
 try:
@@ -29,9 +31,17 @@ FORMAT_TO_DTYPE = {
     'dpcomplex': np.complex128
 }
 
+# pyvips >= 2.2 can convert images to numpy arrays directly
+PYVIPS_HAS_NUMPY = hasattr(pyvips.Image, "numpy")
+
 
 class VIPS(Adapter):
 
+    # crops are independent pipelines and fetches on the shared region are locked
+    THREAD_SAFE = True
+    # crops are written straight into a caller-owned array wrapped as a VIPS memory image
+    READS_INTO_OUT = True
+
     def __init__(self, filepath: str):
         """__init__ Initialize VIPS adapter object
 
@@ -39,6 +49,26 @@ class VIPS(Adapter):
         :type filepath: str
         """
         self._image = pyvips.Image.new_from_file(filepath, access="random")
+        # openslide-backed formats carry an alpha band which isn't wanted in the output,
+        # only the last band is dropped so grey+alpha images keep their single grey band
+        if self._image.hasalpha():
+            self._image = self._image[:-1]
+        # a single region is reused across fetches rather than being rebuilt per call
+        self._region = pyvips.Region.new(self._image)
+        # regions aren't thread-safe, so concurrent fetches on the shared region are serialized
+        self._region_lock = threading.Lock()
+        # the image is immutable, so its dimensions are read across cffi only once
+        self._width = int(self._image.width)
+        self._height = int(self._image.height)
+        # every region shares the image's format and bands, so they're looked up only once too
+        self._format = self._image.format
+        self._dtype = FORMAT_TO_DTYPE[self._format]
+        self._bands = int(self._image.bands)
+        try:
+            self._tile_dims = (int(self._image.get('tile-width')),
+                               int(self._image.get('tile-height')))
+        except pyvips.Error:
+            self._tile_dims = config.VIPS_DEFAULT_TILE_DIMS
 
     def get_width(self) -> int:
         """get_height Get the height property of the image using VIPS' implementation
@@ -46,7 +76,7 @@ class VIPS(Adapter):
         :return: Height in pixels
         :rtype: int
         """
-        return self._image.width
+        return self._width
 
     def get_height(self) -> int:
         """get_height Get the height property of the image using VIPS' implementation
@@ -54,33 +84,105 @@ class VIPS(Adapter):
         :return: Height in pixels
         :rtype: int
         """
-        return self._image.height
+        return self._height
 
-    def get_region(self, region_coordinates, region_dims) -> np.ndarray:
+    def get_tile_dims(self) -> tuple:
+        """get_tile_dims Get the dimensions of the tiles the image is stored in using VIPS' implementation
+
+        :return: Tile width and height in pixels, falling back to VIPS_DEFAULT_TILE_DIMS when the image doesn't expose them
+        :rtype: tuple
+        """
+        return self._tile_dims
+
+    def get_region(self, region_coordinates, region_dims, out=None) -> np.ndarray:
         """get_region Get a pixel region of the image using VIPS' implementation
 
         :param region_coordinates: A set of (width, height) coordinates representing the top-left pixel of the region
         :type region_coordinates: Iterable
         :param region_dims: A set of (width, height) coordinates representing the region dimensions
         :type region_dims: Iterable
-        :return: A numpy array representative of the pixel region from the image
+        :param out: A caller-owned array of shape (height, width, bands) to write the region into, defaults to None
+        :type out: Optional[np.ndarray], optional
+        :return: A numpy array representative of the pixel region from the image (out if it was provided)
         :rtype: np.ndarray
         """
-        if config.VIPS_GET_REGION == "IMAGE_CROP":
+        get_region_mode = config.VIPS_GET_REGION
+        if get_region_mode == "AUTO":
+            # fetching skips building a crop pipeline, which pays off for small regions only
+            region_width, region_height = region_dims
+            get_region_mode = "REGION_FETCH" \
+                if region_width * region_height < config.VIPS_FETCH_AREA_THRESHOLD \
+                else "IMAGE_CROP"
+        if get_region_mode == "IMAGE_CROP":
             output_img = self._image.crop(*region_coordinates, *region_dims)
-            np_output = np.ndarray(
-                buffer=output_img.write_to_memory(),
-                dtype=FORMAT_TO_DTYPE[output_img.format],
-                shape=[output_img.height, output_img.width, output_img.bands]
-            )
-            return np_output
-        elif config.VIPS_GET_REGION == "REGION_FETCH":
-            vips_region = pyvips.Region.new(self._image)
-            bytestring_buffer = vips_region.fetch(
-                *region_coordinates, *region_dims)
-            np_output = np.frombuffer(bytestring_buffer, dtype=np.uint8)
-            region = np_output.reshape(*region_dims, 3)
-            return region
+            region_width, region_height = region_dims
+            if out is not None and self._can_write_into(out, region_dims):
+                # the crop is evaluated directly into out, skipping the intermediate array and copy
+                output_img.write(pyvips.Image.new_from_memory(
+                    out.data, region_width, region_height, self._bands, self._format))
+                return out
+            if PYVIPS_HAS_NUMPY:
+                # numpy() squeezes single-band images to 2-D, the bands axis is kept like the other paths
+                region = output_img.numpy().reshape(
+                    region_height, region_width, self._bands)
+            else:
+                buffer = output_img.write_to_memory()
+                np_output = np.frombuffer(buffer, dtype=self._dtype)
+                region = np_output.reshape(
+                    region_height, region_width, self._bands)
+        elif get_region_mode == "REGION_FETCH":
+            with self._region_lock:
+                bytestring_buffer = self._region.fetch(
+                    *region_coordinates, *region_dims)
+            np_output = np.frombuffer(bytestring_buffer, dtype=self._dtype)
+            region_width, region_height = region_dims
+            region = np_output.reshape(
+                region_height, region_width, self._bands)
         else:
             raise Exception(
                 f"Invalid vips get region mode {config.VIPS_GET_REGION=}")
+        if out is not None:
+            np.copyto(out, region)
+            return out
+        return region
+
+    def _can_write_into(self, out: np.ndarray, region_dims) -> bool:
+        """_can_write_into Check whether VIPS can write a region straight into out's memory
+
+        :param out: The caller-owned array the region is to be written into
+        :type out: np.ndarray
+        :param region_dims: A set of (width, height) coordinates representing the region dimensions
+        :type region_dims: Iterable
+        :return: Whether out is a writeable C-contiguous array of the region's shape and the image's dtype
+        :rtype: bool
+        """
+        region_width, region_height = region_dims
+        return out.shape == (region_height, region_width, self._bands) \
+            and out.dtype == self._dtype \
+            and out.flags.c_contiguous and out.flags.writeable
+
+    def get_regions(self, region_coordinates, region_dims, out=None) -> np.ndarray:
+        """get_regions Get a batch of same-sized pixel regions of the image by fetching them from the shared region
+
+        :param region_coordinates: A sequence of (width, height) coordinates representing the top-left pixel of each region
+        :type region_coordinates: Iterable
+        :param region_dims: A set of (width, height) coordinates representing the dimensions shared by the regions
+        :type region_dims: Iterable
+        :param out: A caller-owned array of shape (number of regions, height, width, bands) to write the regions into, defaults to None
+        :type out: Optional[np.ndarray], optional
+        :return: A numpy array whose nth entry is the nth region (out if it was provided)
+        :rtype: np.ndarray
+        """
+        region_width, region_height = region_dims
+        dtype = self._dtype
+        bands = self._bands
+        if out is None:
+            out = np.empty((len(region_coordinates), region_height,
+                           region_width, bands), dtype=dtype)
+        with self._region_lock:
+            for i, (left, top) in enumerate(region_coordinates):
+                bytestring_buffer = self._region.fetch(
+                    int(left), int(top), region_width, region_height)
+                out[i] = np.frombuffer(bytestring_buffer, dtype=dtype).reshape(
+                    region_height, region_width, bands)
+        return out
@@ -1,2 +1,9 @@
 
+import os
+
 DEFAULT_REGION_DIMS = (512, 512)
+
+DEFAULT_PREFETCH_DEPTH = min(8, os.cpu_count() or 1)  # 0 disables prefetching
+
+# decoded regions kept by ImageReaderDirectory, 0 disables caching (cached regions are returned read-only)
+DIRECTORY_READER_CACHE_BYTES = 0
@@ -3,6 +3,8 @@
     An interface into optimized image reading behavior with optional overriding.
 """
 
+import collections
+import concurrent.futures
 import contextlib
 from typing import Optional
 
@@ -18,19 +20,25 @@ class Image(contextlib.AbstractContextManager):
     Image An image to be streamed into a specialized reader 
     """
 
-    def __init__(self, filepath, reader=None):
+    def __init__(self, filepath, reader=None, prefetch=config.DEFAULT_PREFETCH_DEPTH):
         """__init__ Initialize Image object
 
         :param filepath: Filepath to image file to be opened
         :type filepath: str
         :param reader: Interface to reading the image file, defaults to None
         :type reader: ImageReader or custom class supportive of the same functions, optional
+        :param prefetch: Number of regions read ahead on background threads while iterating, if the reader is thread-safe, defaults to DEFAULT_PREFETCH_DEPTH
+        :type prefetch: int, optional
         """
         self.filepath = filepath
         self.reader = reader or image_reader.ImageReader(filepath)
-        self._iter = None
+        self.prefetch = prefetch
+        self._coords = None
+        self._coords_resolved = False
+        self._tile_coords = None
+        self._executor = None
 
-    def get_region(self, region_identifier, region_dims=config.DEFAULT_REGION_DIMS) -> np.ndarray:
+    def get_region(self, region_identifier, region_dims=config.DEFAULT_REGION_DIMS, out=None, dtype=None) -> np.ndarray:
         """
         get_region Get a pixel region from the image
 
@@ -38,10 +46,16 @@ class Image(contextlib.AbstractContextManager):
         :type region_identifier: Union[int, Iterable]
         :param region_dims: A set of (width, height) coordinates representing the region dimensions, defaults to DEFAULT_REGION_DIMS
         :type region_dims: Iterable, optional
-        :return: A numpy array representative of the pixel region from the image
+        :param out: A caller-owned array to write the region into (see util.RegionPool), defaults to None
+        :type out: Optional[np.ndarray], optional
+        :param dtype: A floating point dtype to convert the region to, scaling its pixel values to [0, 1], defaults to None (no conversion)
+        :type dtype: Optional[np.dtype], optional
+        :return: A numpy array representative of the pixel region from the image (out if it was provided)
         :rtype: np.ndarray
         """
-        return self.reader.get_region(region_identifier, region_dims)
+        if out is None and dtype is None:
+            return self.reader.get_region(region_identifier, region_dims)
+        return self.reader.get_region(region_identifier, region_dims, out=out, dtype=dtype)
 
     def number_of_regions(self, region_dims=config.DEFAULT_REGION_DIMS) -> int:
         """
@@ -86,29 +100,59 @@ class Image(contextlib.AbstractContextManager):
 
     def __iter__(self):
         """
-        __iter__ Initialize Image object iterator
+        __iter__ Initialize an iterator over the pixel regions of the Image object, in region index order
 
-        :raises Exception: Iterator already initialized but is called again
-        :return: Iterator for Image object
-        :rtype: Image
+        :return: Iterator over the pixel regions of the Image object, independent of any other iterator
+        :rtype: _RegionIterator
         """
-        self._iter = 0
-        return self
+        if not self._coords_resolved:
+            # precompute region coordinates so iteration skips the per-region index math
+            self._coords = None
+            if hasattr(self.reader, "region_coordinates_grid"):
+                try:
+                    self._coords = self.reader.region_coordinates_grid(
+                        config.DEFAULT_REGION_DIMS)
+                except NotImplementedError:
+                    pass
+            self._coords_resolved = True
+        return _RegionIterator(self.reader, self._coords, 0, config.DEFAULT_REGION_DIMS,
+                               self._get_executor(self._coords), self.prefetch)
 
-    def __next__(self):
+    def iter_tile_order(self):
         """
-        __next__ Get the next pixel region index in a sequence of iterating through an Image object
+        iter_tile_order Initialize an iterator over the pixel regions of the Image object that visits every region within one
+            block of the image's tiles before moving on, to make the most of the adapter library's tile cache
 
-        :raises StopIteration: Iterator has reached the last region in the image
-        :return: Next pixel region index
-        :rtype: int
+        :raises NotImplementedError: The reader doesn't support a region coordinate grid
+        :return: Iterator over ((width, height) coordinates of the top-left pixel, pixel region) pairs
+        :rtype: _RegionIterator
         """
-        if self._iter >= self.number_of_regions():
-            raise StopIteration
-        else:
-            region = self.get_region(self._iter)
-            self._iter += 1
-            return region
+        if self._tile_coords is None:
+            if not hasattr(self.reader, "region_coordinates_grid"):
+                raise NotImplementedError(
+                    f"{type(self.reader)} doesn't support region coordinate grids")
+            self._tile_coords = self.reader.region_coordinates_grid(
+                config.DEFAULT_REGION_DIMS, getattr(self.reader, "tile_size", None))
+        return _RegionIterator(self.reader, self._tile_coords, 0, config.DEFAULT_REGION_DIMS,
+                               self._get_executor(self._tile_coords), self.prefetch,
+                               with_coordinates=True)
+
+    def _get_executor(self, coords):
+        """
+        _get_executor Get the thread pool regions are read ahead on, creating it on first use
+
+        :param coords: The precomputed region coordinates about to be iterated over, or None
+        :type coords: Optional[np.ndarray]
+        :return: The thread pool, or None if regions aren't read ahead
+        :rtype: Optional[concurrent.futures.ThreadPoolExecutor]
+        """
+        # only readers whose adapter declares itself thread-safe (e.g. VIPS, which releases the GIL while decoding) read ahead
+        if not getattr(self.reader, "thread_safe", False):
+            return None
+        if coords is not None and self.prefetch > 0 and self._executor is None:
+            self._executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=self.prefetch)
+        return self._executor
 
     def __len__(self):
         """
@@ -119,5 +163,107 @@ class Image(contextlib.AbstractContextManager):
         """
         return self.number_of_regions()
 
-    def __exit__(self, **kwargs) -> Optional[bool]:
-        return super().__exit__(**kwargs)
+    def close(self):
+        """
+        close Shut down the prefetch thread pool, after which iterators read their remaining regions directly
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def __exit__(self, exc_type, exc, tb) -> Optional[bool]:
+        self.close()
+        return None
+
+
+class _RegionIterator():
+
+    """
+    _RegionIterator Iterates over the pixel regions of an image, holding its own position so that iterators don't interfere
+    """
+
+    __slots__ = ('_reader', '_coords', '_i', '_dims',
+                 '_executor', '_prefetch', '_futures', '_with_coordinates')
+
+    def __init__(self, reader, coords, i, region_dims, executor=None, prefetch=0, with_coordinates=False):
+        """
+        __init__ Initialize _RegionIterator object
+
+        :param reader: Interface to reading the image file
+        :type reader: ImageReader or custom class supportive of the same functions
+        :param coords: Precomputed region coordinates, or None to get regions by index through the reader
+        :type coords: Optional[np.ndarray]
+        :param i: Index of the first region to be returned
+        :type i: int
+        :param region_dims: A set of (width, height) coordinates representing the region dimensions
+        :type region_dims: Iterable
+        :param executor: Thread pool to read regions ahead on, defaults to None
+        :type executor: Optional[concurrent.futures.Executor], optional
+        :param prefetch: Number of regions read ahead when an executor is given, defaults to 0
+        :type prefetch: int, optional
+        :param with_coordinates: Whether to return ((width, height) coordinates, region) pairs rather than bare regions, only
+            supported with precomputed coordinates, defaults to False
+        :type with_coordinates: bool, optional
+        """
+        self._reader = reader
+        self._coords = coords
+        self._i = i
+        self._dims = region_dims
+        self._executor = executor if coords is not None and prefetch > 0 else None
+        self._prefetch = prefetch
+        self._futures = collections.deque()
+        self._with_coordinates = with_coordinates
+        if self._executor is not None:
+            for region_index in range(i, min(i + prefetch, len(coords))):
+                self._submit_prefetch(region_index)
+
+    def _submit_prefetch(self, region_index):
+        """
+        _submit_prefetch Schedule a region from the precomputed coordinate grid to be read on the thread pool
+
+        :param region_index: The index of the region to be read
+        :type region_index: int
+        """
+        region_coordinates = tuple(self._coords[region_index].tolist())
+        try:
+            self._futures.append(self._executor.submit(
+                self._reader._get_region, region_coordinates, self._dims))
+        except RuntimeError:  # the pool was shut down by Image.close
+            self._executor = None
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        """
+        __next__ Get the next pixel region in a sequence of iterating through an Image object
+
+        :raises StopIteration: Iterator has reached the last region in the image
+        :return: Next pixel region, paired with its coordinates if the iterator was made with_coordinates
+        :rtype: Union[np.ndarray, Tuple[Tuple[int, int], np.ndarray]]
+        """
+        i = self._i
+        coords = self._coords
+        if coords is not None:
+            # grid coordinates are always in bounds, so the region isn't validated again
+            if i >= len(coords):
+                raise StopIteration
+            if self._futures:
+                region = self._futures.popleft().result()
+                if self._executor is not None and i + self._prefetch < len(coords):
+                    self._submit_prefetch(i + self._prefetch)
+            else:
+                region = self._reader._get_region(
+                    tuple(coords[i].tolist()), self._dims)
+            if self._with_coordinates:
+                region = (tuple(coords[i].tolist()), region)
+        elif i >= self._reader.number_of_regions(self._dims):
+            raise StopIteration
+        else:
+            region = self._reader.get_region(i, self._dims)
+        self._i = i + 1
+        return region
+
+    def __del__(self):
+        for future in self._futures:
+            future.cancel()
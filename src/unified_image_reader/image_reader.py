@@ -2,20 +2,32 @@
     An ImageReader controls the behavior of the image interface. It can either utilize an adapter on a library or custom behavior.
 """
 
+import collections
+import concurrent.futures
 import os
-from typing import Any, Iterable, Optional, Tuple, Union
+from typing import Any, Callable, Iterable, Iterator, Optional, Tuple, Union
 
 import cv2 as cv
 import numpy as np
 
+try:  # libjpeg-turbo's SIMD decoder is optional, OpenCV decodes JPEG tiles without it
+    import turbojpeg
+    TURBOJPEG = turbojpeg.TurboJPEG()
+except (ImportError, OSError, RuntimeError):
+    TURBOJPEG = None
+
+from unified_image_reader import _hot, config, util
 from unified_image_reader.adapters import Adapter, SlideIO, VIPS
 
-FORMAT_ADAPTER_MAP = {
+FORMAT_ADAPTER_MAP = {  # keys are lowercase, formats are matched case-insensitively
     "tif": VIPS,
     "tiff": VIPS,
     "svs": SlideIO
 }
 
+MEMMAP_REGION_FORMATS = (".npy",)  # region files ImageReaderDirectory memory-maps instead of decoding
+JPEG_REGION_FORMATS = (".jpg", ".jpeg")  # region files ImageReaderDirectory decodes with PyTurboJPEG when available
+
 
 class UnsupportedFormatException(Exception):
     pass
@@ -40,6 +52,10 @@ class ImageReader():
     :raises InvalidDimensionsException: Dimensions of the pixel region were not provided in (width, height) format
     """
 
+    # one reader is opened per slide, so instances skip the per-instance __dict__
+    __slots__ = ('filepath', 'adapter', '_width',
+                 '_height', '_dims', '_grid_cache')
+
     def __init__(self, filepath: str, adapter: Union[Adapter, None] = None):
         """
         __init__ Initialize ImageReader object
@@ -48,23 +64,30 @@ class ImageReader():
         :type filepath: str
         :param adapter: Object which specifies reading behavior, defaults to None
         :type adapter: Union[Adapter, None], optional
+        :raises FileNotFoundError: filepath isn't a file
         :raises UnsupportedFormatException: The adapter does not support the image format
         """
         # process filepath
-        assert os.path.isfile(
-            filepath), f"filepath is not a file --> {filepath}"
+        # raised explicitly because asserts are stripped under -O
+        if not os.path.isfile(filepath):
+            raise FileNotFoundError(f"filepath is not a file --> {filepath}")
 
         self.filepath = filepath
         # initialize the adapter
         self.adapter = None
         if adapter is None:  # choose based on file format
-            image_format = self.filepath.split('.')[-1]
+            image_format = self.filepath.rpartition('.')[2].lower()
             adapter = FORMAT_ADAPTER_MAP.get(image_format)
             if adapter is None:
                 raise UnsupportedFormatException(image_format)
         self.adapter = adapter(filepath)
+        # the image doesn't change for the reader's lifetime, so cache its dimensions
+        self._width = self.adapter.get_width()
+        self._height = self.adapter.get_height()
+        self._dims = (self._width, self._height)
+        self._grid_cache = {}
 
-    def get_region(self, region_identifier: Union[int, Iterable], region_dims: Iterable):
+    def get_region(self, region_identifier: Union[int, Iterable], region_dims: Iterable, out: Optional[np.ndarray] = None, dtype=None):
         """
         get_region Get a pixel region from an image using an adapter's implementation after validation and extracting region data
 
@@ -73,38 +96,202 @@ class ImageReader():
         :type region_identifier: Union[int, Iterable]
         :param region_dims: A set of (weight, height) coordinates representing the region dimensions
         :type region_dims: Iterable
+        :param out: A caller-owned array to write the region into (see util.RegionPool), defaults to None
+        :type out: Optional[np.ndarray], optional
+        :param dtype: A floating point dtype to convert the region to, scaling its pixel values to [0, 1], defaults to None (no conversion)
+        :type dtype: Optional[np.dtype], optional
         :return: A numpy array representative of the pixel region from the image
         :rtype: np.ndarray
         """
-        # Make sure that region_coordinates is a tuple of length 2
-        region_coordinates = None
-        if isinstance(region_identifier, int):
-            region_coordinates = self.region_index_to_coordinates(
-                region_identifier, region_dims)
+        # exact type checks catch the usual int and tuple identifiers without walking the Iterable ABC
+        identifier_type = type(region_identifier)
+        if identifier_type is int:
+            return self.get_region_by_index(region_identifier, region_dims, out, dtype)
+        elif identifier_type is tuple:
+            return self.get_region_by_xy(region_identifier, region_dims, out, dtype)
+        elif isinstance(region_identifier, int):
+            return self.get_region_by_index(region_identifier, region_dims, out, dtype)
         elif isinstance(region_identifier, Iterable):
-            assert (len(region_identifier) == 2)
-            region_coordinates = region_identifier
+            return self.get_region_by_xy(region_identifier, region_dims, out, dtype)
         else:
             raise TypeError(
                 f"region_identifier should be either int or Iterable but is {type(region_identifier)=}, {region_identifier=}")
+
+    def get_region_by_index(self, region_index: int, region_dims: Iterable, out: Optional[np.ndarray] = None, dtype=None) -> np.ndarray:
+        """
+        get_region_by_index Get a pixel region from an image by its index, skipping get_region's type dispatch
+
+        :param region_index: The nth region of the image (where n >= 0) based on region dimensions
+        :type region_index: int
+        :param region_dims: A set of (width, height) coordinates representing the region dimensions
+        :type region_dims: Iterable
+        :param out: A caller-owned array to write the region into (see util.RegionPool), defaults to None
+        :type out: Optional[np.ndarray], optional
+        :param dtype: A floating point dtype to convert the region to, scaling its pixel values to [0, 1], defaults to None (no conversion)
+        :type dtype: Optional[np.dtype], optional
+        :raises IndexError: The region is out of the bounds of the image
+        :raises InvalidDimensionsException: Dimensions of the pixel region were not provided in (width, height) format
+        :return: A numpy array representative of the pixel region from the image
+        :rtype: np.ndarray
+        """
+        # scalar math stays in Python, a compiled call costs more to dispatch than the few operations it would replace
+        if not (len(region_dims) == 2):
+            raise InvalidDimensionsException(region_dims)
+        region_width, region_height = region_dims
+        width, height = self.dims
+        if not (0 < region_width <= width and 0 < region_height <= height):
+            raise IndexError(region_index, region_dims, self.dims)
+        width_regions, _ = self._grid_shape(region_dims)
+        row, column = divmod(region_index, width_regions)
+        left, top = column * region_width, row * region_height
+        if not (0 <= top and top + region_height <= height):
+            raise IndexError((left, top), region_dims, self.dims)
+        return self._get_region((left, top), region_dims, out, dtype)
+
+    def get_region_by_xy(self, region_coordinates: Iterable, region_dims: Iterable, out: Optional[np.ndarray] = None, dtype=None) -> np.ndarray:
+        """
+        get_region_by_xy Get a pixel region from an image by the coordinates of its top-left pixel, skipping get_region's type dispatch
+
+        :param region_coordinates: A set of (width, height) coordinates representing the top-left pixel of the region
+        :type region_coordinates: Iterable
+        :param region_dims: A set of (width, height) coordinates representing the region dimensions
+        :type region_dims: Iterable
+        :param out: A caller-owned array to write the region into (see util.RegionPool), defaults to None
+        :type out: Optional[np.ndarray], optional
+        :param dtype: A floating point dtype to convert the region to, scaling its pixel values to [0, 1], defaults to None (no conversion)
+        :type dtype: Optional[np.dtype], optional
+        :raises IndexError: The region is out of the bounds of the image
+        :raises InvalidCoordinatesException: The top-left pixel was not provided in (width, height) format
+        :raises InvalidDimensionsException: Dimensions of the pixel region were not provided in (width, height) format
+        :return: A numpy array representative of the pixel region from the image
+        :rtype: np.ndarray
+        """
         # make sure that the region is in bounds
         self.validate_region(region_coordinates, region_dims)
         # call the implementation
-        return self._get_region(region_coordinates, region_dims)
+        return self._get_region(region_coordinates, region_dims, out, dtype)
 
-    def _get_region(self, region_coordinates, region_dims) -> np.ndarray:
+    def get_regions(self, region_identifiers: Iterable, region_dims: Iterable, out: Optional[np.ndarray] = None) -> np.ndarray:
         """
-        _get_region Call an adapter's implementation to get a pixel region from an image
+        get_regions Get a batch of same-sized pixel regions from an image, validating and locating all of them at once
+
+        :param region_identifiers: An array of region indices, or an (N, 2) array of (width, height) coordinates of the top-left pixel of each region
+        :type region_identifiers: Iterable
+        :param region_dims: A set of (width, height) coordinates representing the dimensions shared by the regions
+        :type region_dims: Iterable
+        :param out: A caller-owned array of shape (N, height, width, bands) to write the regions into, defaults to None
+        :type out: Optional[np.ndarray], optional
+        :raises IndexError: Any of the regions are out of the bounds of the image
+        :raises InvalidCoordinatesException: The coordinates were not provided in (width, height) format
+        :raises InvalidDimensionsException: Dimensions of the pixel regions were not provided in (width, height) format
+        :return: A numpy array whose nth entry is the nth region (out if it was provided)
+        :rtype: np.ndarray
+        """
+        if not (len(region_dims) == 2):
+            raise InvalidDimensionsException(region_dims)
+        region_width, region_height = region_dims
+        region_identifiers = np.ascontiguousarray(
+            region_identifiers, dtype=np.int64)
+        if region_identifiers.ndim == 1:
+            if not (0 < region_width <= self.width):
+                raise IndexError(region_dims, self.dims)
+            region_coordinates = _hot.idx_to_xy(
+                region_identifiers, region_width, region_height, self.width)
+        elif region_identifiers.ndim == 2 and region_identifiers.shape[1] == 2:
+            region_coordinates = region_identifiers
+        else:
+            raise InvalidCoordinatesException(region_identifiers.shape)
+        in_bounds = _hot.coords_in_bounds(
+            region_coordinates, region_width, region_height, self.width, self.height)
+        if not np.all(in_bounds):
+            raise IndexError(region_identifiers[~in_bounds], region_dims, self.dims)
+        return self.adapter.get_regions(region_coordinates.tolist(), region_dims, out)
+
+    def _get_region(self, region_coordinates, region_dims, out=None, dtype=None) -> np.ndarray:
+        """
+        _get_region Call an adapter's implementation to get a pixel region from an image without validating the region
+
+        Callers must already know that the region is in bounds (e.g. coordinates from region_coordinates_grid)
 
         :param region_coordinates: A set of (width, height) coordinates representing the top-left pixel of the region
         :type region_coordinates: Iterable
         :param region_dims: A set of (width, height) coordinates representing the region dimensions
         :type region_dims: Iterable
+        :param out: A caller-owned array to write the region into, defaults to None
+        :type out: Optional[np.ndarray], optional
+        :param dtype: A floating point dtype to convert the region to, scaling its pixel values to [0, 1], defaults to None (no conversion)
+        :type dtype: Optional[np.dtype], optional
         :return: Implementation resulting in a numpy array representative of the pixel region from the image
         :rtype: np.ndarray
         """
 
-        return self.adapter.get_region(region_coordinates, region_dims)
+        if out is not None and dtype is None and getattr(self.adapter, "READS_INTO_OUT", False):
+            return self.adapter.get_region(region_coordinates, region_dims, out)
+        # other adapters implement get_region(region_coordinates, region_dims), so the region is copied into out here
+        region = self.adapter.get_region(region_coordinates, region_dims)
+        if dtype is not None:
+            return util.normalize_region(region, dtype, out)
+        if out is not None:
+            np.copyto(out, region)
+            return out
+        return region
+
+    def specialize(self, region_dims: Iterable) -> Callable[[int], np.ndarray]:
+        """
+        specialize Build a get-region-by-index function with the region dimensions baked in, for runs that only ever read same-sized regions
+
+        Validating the dimensions and working out the grid happens once here, so each call only checks the index range
+        before the divmod and the adapter call.
+
+        :param region_dims: A set of (width, height) coordinates representing the region dimensions
+        :type region_dims: Iterable
+        :raises InvalidDimensionsException: Dimensions of the pixel region were not provided in (width, height) format
+        :raises IndexError: The region dimensions are out of the bounds of the image
+        :return: A function taking a region index and returning that region as a numpy array
+        :rtype: Callable[[int], np.ndarray]
+        """
+
+        if not (len(region_dims) == 2):
+            raise InvalidDimensionsException(region_dims)
+        region_width, region_height = region_dims
+        if not (0 < region_width <= self.width and 0 < region_height <= self.height):
+            raise IndexError(region_dims, self.dims)
+        region_dims = (region_width, region_height)
+        width_regions, height_regions = self._grid_shape(region_dims)
+        max_index = width_regions * height_regions
+        adapter_get_region = self.adapter.get_region
+
+        def get_region_specialized(region_index: int) -> np.ndarray:
+            if not (0 <= region_index < max_index):
+                raise IndexError(region_index, max_index)
+            row, column = divmod(region_index, width_regions)
+            return adapter_get_region((column * region_width, row * region_height), region_dims)
+
+        return get_region_specialized
+
+    def iter_regions(self, region_dims: Iterable, out: Optional[np.ndarray] = None) -> Iterator[np.ndarray]:
+        """
+        iter_regions Iterate over every region of the image in index order, reading each one into the same buffer
+
+        Adapters that read straight into out (READS_INTO_OUT, e.g. VIPS crops) write each region into the buffer without
+        an intermediate array. For other adapters each region is read as usual and then copied into the buffer, which
+        costs one extra copy per region. The buffer is overwritten on every step, so copy anything that must be kept.
+
+        :param region_dims: A set of (width, height) coordinates representing the region dimensions
+        :type region_dims: Iterable
+        :param out: A caller-owned array of shape (height, width, bands) to read the regions into, defaults to None (allocated on the first region)
+        :type out: Optional[np.ndarray], optional
+        :return: The buffer, holding the next region
+        :rtype: Iterator[np.ndarray]
+        """
+
+        for left, top in self.region_coordinates_grid(region_dims).tolist():
+            if out is None:
+                region = self._get_region((left, top), region_dims)
+                out = region if region.flags.writeable else region.copy()
+            else:
+                self._get_region((left, top), region_dims, out)
+            yield out
 
     def number_of_regions(self, region_dims: Iterable):
         """
@@ -116,8 +303,27 @@ class ImageReader():
         :rtype: int
         """
 
-        width, height = region_dims
-        return (self.width // width) * (self.height // height)
+        width_regions, height_regions = self._grid_shape(region_dims)
+        return width_regions * height_regions
+
+    def _grid_shape(self, region_dims: Iterable) -> Tuple[int, int]:
+        """
+        _grid_shape Calculates how many regions fit across and down the image, caching the result per region dimensions
+
+        :param region_dims: A set of (width, height) coordinates representing the region dimensions
+        :type region_dims: Iterable
+        :return: The number of regions across and down the image
+        :rtype: Tuple[int, int]
+        """
+
+        key = tuple(region_dims)
+        grid_shape = self._grid_cache.get(key)
+        if grid_shape is None:
+            region_width, region_height = key
+            width, height = self.dims
+            grid_shape = (width // region_width, height // region_height)
+            self._grid_cache[key] = grid_shape
+        return grid_shape
 
     def validate_region(self, region_coordinates: Iterable, region_dims: Iterable) -> None:
         """
@@ -132,30 +338,31 @@ class ImageReader():
         :raises InvalidDimensionsException: Dimensions of the pixel region were not presented in (width, height) format
         """
 
-        def not_valid():
-            """
-            not_valid Wrapper function to raise an error on invalid coordinates or dimensions
+        self._check_shapes(region_coordinates, region_dims)
+        left, top = region_coordinates
+        region_width, region_height = region_dims
+        width, height = self.dims
+        # a single predicate, with left < width and top < height implied by the positive region dimensions
+        if not (0 <= left and 0 < region_width and left + region_width <= width
+                and 0 <= top and 0 < region_height and top + region_height <= height):
+            raise IndexError(region_coordinates, region_dims, self.dims)
 
-            :raises IndexError: The top-left pixel or pixel region dimensions are out of the bounds of the image dimensions
-            """
+    def _check_shapes(self, region_coordinates: Iterable, region_dims: Iterable) -> None:
+        """
+        _check_shapes Checks that the coordinates and dimensions of a region are both in (width, height) format
+
+        :param region_coordinates: A set of (width, height) coordinates representing the top-left pixel of the region
+        :type region_coordinates: Iterable
+        :param region_dims: A set of (width, height) coordinates representing the region dimensions
+        :type region_dims: Iterable
+        :raises InvalidCoordinatesException: The top-left pixel was not presented in (width, height) format
+        :raises InvalidDimensionsException: Dimensions of the pixel region were not presented in (width, height) format
+        """
 
-            raise IndexError(region_coordinates, region_dims, self.dims)
-        # first ensure coordinates are in bounds
         if not (len(region_coordinates) == 2):
             raise InvalidCoordinatesException(region_coordinates)
-        left, top = region_coordinates
-        if not (0 <= left < self.width):
-            not_valid()
-        if not (0 <= top < self.height):
-            not_valid()
-        # then check dimensions with coordinates
         if not (len(region_dims) == 2):
             raise InvalidDimensionsException(region_dims)
-        region_width, region_height = region_dims
-        if not (0 < region_width and left+region_width <= self.width):
-            not_valid()
-        if not (0 < region_height and top+region_height <= self.height):
-            not_valid()
 
     def region_index_to_coordinates(self, region_index: int, region_dims: Iterable):
         """
@@ -170,11 +377,41 @@ class ImageReader():
         """
 
         region_width, region_height = region_dims
-        width_regions = self.width // region_width
+        width_regions, _ = self._grid_shape(region_dims)
         left = (region_index % width_regions) * region_width
         top = (region_index // width_regions) * region_height
         return (left, top)
 
+    def region_coordinates_grid(self, region_dims: Iterable, tile_dims: Optional[Iterable] = None) -> np.ndarray:
+        """
+        region_coordinates_grid Precomputes the coordinates of the top-left pixel of every region
+
+        :param region_dims: A set of (width, height) coordinates representing the region dimensions
+        :type region_dims: Iterable
+        :param tile_dims: A set of (width, height) coordinates representing the dimensions of the tiles the image is stored in, defaults to None
+        :type tile_dims: Optional[Iterable], optional
+        :return: An array of shape (number_of_regions, 2) of (width, height) coordinates, ordered by region index unless
+            tile_dims is given, in which case all of the regions within one block of tiles are visited before moving on
+        :rtype: np.ndarray
+        """
+
+        region_width, region_height = region_dims
+        width_regions, height_regions = self._grid_shape(region_dims)
+        lefts = np.arange(0, width_regions * region_width,
+                          region_width, dtype=np.int32)
+        tops = np.arange(0, height_regions * region_height,
+                         region_height, dtype=np.int32)
+        coords = np.stack(np.meshgrid(lefts, tops, indexing='xy'), -1).reshape(-1, 2)
+        if tile_dims is not None:
+            tile_width, tile_height = tile_dims
+            columns = coords[:, 0] // region_width
+            rows = coords[:, 1] // region_height
+            block_columns = columns // max(1, tile_width // region_width)
+            block_rows = rows // max(1, tile_height // region_height)
+            # last key is the primary sort key
+            coords = coords[np.lexsort((columns, rows, block_columns, block_rows))]
+        return coords
+
     @property
     def width(self):
         """
@@ -183,7 +420,7 @@ class ImageReader():
         :return: Width in pixels
         :rtype: int
         """
-        return self.adapter.get_width()
+        return self._width
 
     @property
     def height(self):
@@ -193,7 +430,27 @@ class ImageReader():
         :return: Height in pixels
         :rtype: int
         """
-        return self.adapter.get_height()
+        return self._height
+
+    @property
+    def thread_safe(self):
+        """
+        thread_safe Whether regions may be read from several threads at once, as declared by the adapter
+
+        :return: The adapter's THREAD_SAFE flag
+        :rtype: bool
+        """
+        return getattr(self.adapter, "THREAD_SAFE", False)
+
+    @property
+    def tile_size(self):
+        """
+        tile_size Get the dimensions of the tiles the image is stored in using the adapter's implementation
+
+        :return: Tile width and height in pixels, or None if the adapter doesn't expose them
+        :rtype: Optional[Iterable]
+        """
+        return self.adapter.get_tile_dims()
 
     @property
     def dims(self):
@@ -203,7 +460,7 @@ class ImageReader():
         :return: Width and height in pixels
         :rtype: Iterable
         """
-        return self.width, self.height
+        return self._dims
 
 
 class ImageReaderDirectory(ImageReader):
@@ -213,12 +470,22 @@ class ImageReaderDirectory(ImageReader):
      This works with both a directory and a list of image files.
     """
 
-    def __init__(self, data: Union[str, list, tuple]):
+    __slots__ = ('_dir', '_region_files', '_n_regions', '_imread_flags', '_rgb', '_cache', '_cache_bytes',
+                 '_cache_limit', '_prefetch', '_in_flight', '_executor')
+
+    def __init__(self, data: Union[str, list, tuple], prefetch: int = 0, imread_flags: int = cv.IMREAD_COLOR, rgb: bool = True):
         """
         __init__
 
         :param data: the location(s) of constituent images
         :type data: str
+        :param prefetch: the number of following regions decoded ahead on background threads on each get_region call, defaults to 0 (no read-ahead)
+        :type prefetch: int, optional
+        :param imread_flags: the OpenCV flags the region files are decoded with, e.g. cv.IMREAD_REDUCED_COLOR_2 to have libjpeg decode
+            at half the linear size or cv.IMREAD_GRAYSCALE to skip color conversion, defaults to cv.IMREAD_COLOR
+        :type imread_flags: int, optional
+        :param rgb: whether color regions are returned in RGB order like the adapters' regions rather than OpenCV's BGR, defaults to True
+        :type rgb: bool, optional
         :raises Exception: when data is a string but isn't a directory
         :raises TypeError: when data is neither a string nor list/tuple
         :raises Exception: when a file in data (when data is a list) doesn't exist as a file 
@@ -227,19 +494,33 @@ class ImageReaderDirectory(ImageReader):
             self._dir = data
             if not os.path.isdir(self._dir):
                 raise Exception(f"{data=} should be a path to a directory")
-            self._region_files = [os.path.join(
-                self._dir, p) for p in os.listdir(self._dir)]
-        elif isinstance(data, [list, tuple]):
-            self._region_files = data
+            # DirEntry caches the file type from the directory listing, so is_file doesn't stat each entry again
+            with os.scandir(self._dir) as entries:
+                self._region_files = tuple(sorted(
+                    entry.path for entry in entries if entry.is_file()))
+        elif isinstance(data, (list, tuple)):
+            self._dir = None  # the files may come from any number of directories
+            self._region_files = tuple(sorted(data))
             for region_filepath in self._region_files:
                 if not os.path.isfile(region_filepath):
                     raise Exception(
                         f"self._region_files should be composed of filepaths to existing image files but includes {region_filepath}")
         else:
             raise TypeError(f"Didn't expect {type(data)=}, {data=}")
-        self._region_files.sort()
-
-    def get_region(self, region_identifier: int, region_dims: Optional[Any] = None) -> np.ndarray:
+        self._n_regions = len(self._region_files)
+        self._imread_flags = imread_flags
+        self._rgb = rgb
+        # decoded regions, least recently used first
+        self._cache = collections.OrderedDict()
+        self._cache_bytes = 0
+        self._cache_limit = config.DIRECTORY_READER_CACHE_BYTES
+        # regions being decoded ahead, cv.imdecode releases the GIL so the threads run in parallel
+        self._prefetch = prefetch
+        self._in_flight = {}
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=prefetch) if prefetch > 0 else None
+
+    def get_region(self, region_identifier: int, region_dims: Optional[Any] = None, out: Optional[np.ndarray] = None, dtype=None) -> np.ndarray:
         """
         get_region reads in the image at self._region_files[region_identifier]
 
@@ -247,19 +528,123 @@ class ImageReaderDirectory(ImageReader):
         :type region_identifier: int
         :param region_dims: IGNORED - the regions will be whatever the regions of the image file are, defaults to None
         :type region_dims: Any, optional
+        :param out: a caller-owned array to copy the region into, defaults to None
+        :type out: Optional[np.ndarray], optional
+        :param dtype: a floating point dtype to convert the region to, scaling its pixel values to [0, 1], defaults to None (no conversion)
+        :type dtype: Optional[np.dtype], optional
         :raises NotImplementedError: if the region identifier isn't an index
         :raises IndexError: if region_identifier isn't in range
-        :return: region (the image in the file in question)
+        :return: region (the image in the file in question), read-only if config.DIRECTORY_READER_CACHE_BYTES enables the decoded region cache (which shares it) and neither out nor dtype was provided
         :rtype: np.ndarray
         """
         if not isinstance(region_identifier, int):
             raise NotImplementedError(
                 "This ImageReader only operates on aggregated region files which are indexed alphabetically. Region coordinates are not supported.")
-        if not (0 <= region_identifier < self.number_of_regions()):
+        if not (0 <= region_identifier < self._n_regions):
             raise IndexError(
                 f"{region_identifier=}, {self.number_of_regions()=}")
-        region_filepath = self._region_files[region_identifier]
-        return cv.imread(region_filepath)
+        region = self._cache.get(region_identifier)
+        if region is not None:
+            self._cache.move_to_end(region_identifier)
+        else:
+            future = self._in_flight.pop(region_identifier, None)
+            if future is not None:
+                region = future.result()
+            else:
+                region = self._read_region_file(
+                    self._region_files[region_identifier])
+            if region is not None:
+                self._cache_region(region_identifier, region)
+        if self._executor is not None:
+            self._prefetch_after(region_identifier)
+        if region is None:
+            return region
+        if dtype is not None:
+            return util.normalize_region(region, dtype, out)
+        if out is not None:
+            np.copyto(out, region)
+            return out
+        return region
+
+    def _prefetch_after(self, region_identifier: int) -> None:
+        """
+        _prefetch_after starts decoding the regions following region_identifier that aren't cached or already being decoded
+
+        :param region_identifier: the index of the region that was just read
+        :type region_identifier: int
+        """
+        window = range(region_identifier + 1,
+                       min(region_identifier + 1 + self._prefetch, self._n_regions))
+        # drop read-ahead that the caller has moved away from
+        for stale_identifier in [i for i in self._in_flight if i not in window]:
+            self._in_flight.pop(stale_identifier).cancel()
+        for i in window:
+            if i not in self._cache and i not in self._in_flight:
+                self._in_flight[i] = self._executor.submit(
+                    self._read_region_file, self._region_files[i])
+
+    def close(self) -> None:
+        """
+        close cancels any read-ahead and shuts down the prefetch thread pool
+        """
+        for future in self._in_flight.values():
+            future.cancel()
+        self._in_flight.clear()
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def _read_region_file(self, region_filepath: str) -> Optional[np.ndarray]:
+        """
+        _read_region_file reads the whole file in one call and decodes it from memory rather than letting cv.imread reopen and seek through it,
+            except for .npy files which are memory-mapped rather than decoded (imread_flags doesn't apply to them).
+            JPEG files are decoded with PyTurboJPEG when it's installed and imread_flags is cv.IMREAD_COLOR, except for files
+            with an EXIF orientation other than 1, which go through OpenCV so they're rotated the same way whether or not PyTurboJPEG is installed
+
+        :param region_filepath: the path to the region file
+        :type region_filepath: str
+        :return: the decoded region, or None if it couldn't be decoded
+        :rtype: Optional[np.ndarray]
+        """
+        if region_filepath.lower().endswith(MEMMAP_REGION_FORMATS):
+            # raw arrays need no decoding, so they're mapped in and served from the page cache
+            return np.load(region_filepath, mmap_mode='r')
+        with open(region_filepath, 'rb') as region_file:
+            data = region_file.read()
+        if TURBOJPEG is not None and self._imread_flags == cv.IMREAD_COLOR \
+                and region_filepath.lower().endswith(JPEG_REGION_FORMATS) \
+                and util.jpeg_exif_orientation(data) == 1:
+            # libjpeg-turbo writes the requested channel order during decoding
+            pixel_format = turbojpeg.TJPF_RGB if self._rgb else turbojpeg.TJPF_BGR
+            return TURBOJPEG.decode(data, pixel_format=pixel_format)
+        region = cv.imdecode(np.frombuffer(
+            data, dtype=np.uint8), self._imread_flags)
+        if self._rgb and region is not None and region.ndim == 3:
+            # the freshly decoded buffer is swapped in place rather than copied
+            if region.shape[2] == 3:
+                cv.cvtColor(region, cv.COLOR_BGR2RGB, dst=region)
+            elif region.shape[2] == 4:
+                cv.cvtColor(region, cv.COLOR_BGRA2RGBA, dst=region)
+        return region
+
+    def _cache_region(self, region_identifier: int, region: np.ndarray) -> None:
+        """
+        _cache_region stores a decoded region, evicting the least recently used regions to stay within the cache limit
+
+        :param region_identifier: the index of the file the region was read from
+        :type region_identifier: int
+        :param region: the decoded region
+        :type region: np.ndarray
+        """
+        # memory-mapped regions are already cached by the OS
+        if isinstance(region, np.memmap) or region.nbytes > self._cache_limit:
+            return
+        region.flags.writeable = False
+        self._cache[region_identifier] = region
+        self._cache_bytes += region.nbytes
+        while self._cache_bytes > self._cache_limit:
+            _, evicted = self._cache.popitem(last=False)
+            self._cache_bytes -= evicted.nbytes
 
     def number_of_regions(self, region_dims: Optional[Any] = None) -> int:
         """
@@ -270,7 +655,19 @@ class ImageReaderDirectory(ImageReader):
         :return: the number of regions in this image (the number of the image files)
         :rtype: int
         """
-        return len(self._region_files)
+        return self._n_regions
+
+    def region_coordinates_grid(self, region_dims: Optional[Any] = None, tile_dims: Optional[Any] = None):
+        raise NotImplementedError()
+
+    @property
+    def tile_size(self):
+        return None
+
+    @property
+    def thread_safe(self):
+        # regions are read ahead by the directory reader's own prefetch pool, not by Image
+        return False
 
     @property
     def width(self):
@@ -3,8 +3,11 @@
     Utility functions and classes for the Unified Image Reader
 """
 
+import collections
 import os
-from typing import List, NewType, Tuple, Union
+from typing import List, NewType, Optional, Tuple, Union
+
+import numpy as np
 
 RegionDimensions = NewType('RegionDimensions', Tuple[int, int])
 
@@ -33,3 +36,95 @@ def listdir_recursive(path: FilePath) -> List[FilePath]:
             for file_node in file_nodes
         ]
     return files
+
+
+def normalize_region(region: np.ndarray, dtype, out: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    normalize_region converts a region to a floating point dtype, scaling integer pixel values to [0, 1] in a single pass
+
+    :param region: the region to be converted
+    :type region: np.ndarray
+    :param dtype: the floating point dtype to convert to, e.g. np.float16 to halve the bytes moved downstream compared to np.float32
+    :type dtype: np.dtype
+    :param out: a caller-owned array of that dtype to write the converted region into, defaults to None
+    :type out: Optional[np.ndarray], optional
+    :raises TypeError: if dtype isn't a floating point dtype
+    :return: the converted region (out if it was provided)
+    :rtype: np.ndarray
+    """
+    dtype = np.dtype(dtype)
+    if dtype.kind != 'f':
+        raise TypeError(f"dtype should be a floating point dtype but is {dtype=}")
+    scale = 1 / np.iinfo(region.dtype).max \
+        if np.issubdtype(region.dtype, np.integer) else 1
+    return np.multiply(region, dtype.type(scale), out=out, dtype=dtype)
+
+
+def jpeg_exif_orientation(data: bytes) -> int:
+    """
+    jpeg_exif_orientation reads the EXIF orientation tag of an encoded JPEG without decoding it
+
+    :param data: the bytes of the JPEG file
+    :type data: bytes
+    :return: the orientation tag (1 to 8), or 1 if the file has no (readable) EXIF orientation
+    :rtype: int
+    """
+    # walk the marker segments ahead of the compressed data, looking for the APP1 segment holding EXIF
+    position = 2
+    while position + 4 <= len(data) and data[position] == 0xFF:
+        marker = data[position + 1]
+        if marker == 0xDA:  # start of scan, no more metadata segments
+            break
+        segment_length = int.from_bytes(data[position + 2:position + 4], 'big')
+        segment = data[position + 4:position + 2 + segment_length]
+        if marker == 0xE1 and segment[:6] == b'Exif\x00\x00':
+            tiff = segment[6:]
+            byteorder = 'little' if tiff[:2] == b'II' else 'big'
+            ifd_offset = int.from_bytes(tiff[4:8], byteorder)
+            n_entries = int.from_bytes(tiff[ifd_offset:ifd_offset + 2], byteorder)
+            for entry in range(n_entries):
+                entry_offset = ifd_offset + 2 + 12 * entry
+                if int.from_bytes(tiff[entry_offset:entry_offset + 2], byteorder) == 0x0112:
+                    orientation = int.from_bytes(tiff[entry_offset + 8:entry_offset + 10], byteorder)
+                    return orientation if 1 <= orientation <= 8 else 1
+            return 1
+        position += 2 + segment_length
+    return 1
+
+
+class RegionPool():
+
+    """
+    RegionPool Hands out reusable region arrays, keyed by shape and dtype, to be passed as get_region's out argument
+    """
+
+    def __init__(self):
+        """
+        __init__ Initialize an empty RegionPool
+        """
+        self._free = collections.defaultdict(list)
+
+    def acquire(self, shape: Tuple[int, ...], dtype=np.uint8) -> np.ndarray:
+        """
+        acquire Get an array from the pool, allocating a new one if none of that shape and dtype are free
+
+        :param shape: the shape of the array, i.e. (height, width, bands) for a region
+        :type shape: Tuple[int, ...]
+        :param dtype: the dtype of the array, defaults to np.uint8
+        :type dtype: np.dtype, optional
+        :return: an array whose contents are undefined
+        :rtype: np.ndarray
+        """
+        free = self._free[(tuple(shape), np.dtype(dtype))]
+        if free:
+            return free.pop()
+        return np.empty(shape, dtype=dtype)
+
+    def release(self, array: np.ndarray) -> None:
+        """
+        release Return an array to the pool so that it can be handed out again
+
+        :param array: an array that is no longer used by the caller
+        :type array: np.ndarray
+        """
+        self._free[(array.shape, array.dtype)].append(array)